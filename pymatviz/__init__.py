@@ -12,45 +12,33 @@ import pymatviz
 from __future__ import annotations
 
 import builtins
+import importlib
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING
 
 import plotly.express as px
 
 from pymatviz import (
     bar,
-    brillouin,
-    classify,
-    cluster,
     colors,
-    coordination,
     data,
     enums,
     io,
-    phonons,
     powerups,
     process_data,
     ptable,
-    rdf,
     sankey,
     scatter,
-    structure_viz,
     sunburst,
     templates,
     treemap,
     typing,
     uncertainty,
     utils,
-    xrd,
 )
-from pymatviz.brillouin import brillouin_zone_3d
-from pymatviz.classify import precision_recall_curve_plotly, roc_curve_plotly
-from pymatviz.classify.confusion_matrix import confusion_matrix
-from pymatviz.cluster.composition import cluster_compositions
-from pymatviz.coordination import coordination_hist, coordination_vs_cutoff_line
 from pymatviz.enums import Key, angstrom_per_atom, cubic_angstrom, eV
 from pymatviz.histogram import elements_hist, histogram, spacegroup_bar
 from pymatviz.io import df_to_html, df_to_pdf, df_to_svg, save_fig
-from pymatviz.phonons import phonon_bands, phonon_bands_and_dos, phonon_dos
 from pymatviz.process_data import count_elements, count_formulas
 from pymatviz.ptable import (
     ptable_heatmap_plotly,
@@ -59,7 +47,6 @@ from pymatviz.ptable import (
     ptable_scatter_plotly,
 )
 from pymatviz.rainclouds import rainclouds
-from pymatviz.rdf.plotly import element_pair_rdfs, full_rdf
 from pymatviz.sankey import sankey_from_2_df_cols
 from pymatviz.scatter import (
     density_hexbin,
@@ -70,11 +57,6 @@ from pymatviz.scatter import (
     residual_vs_actual,
     scatter_with_err_bar,
 )
-from pymatviz.structure_viz import (
-    structure_2d,
-    structure_2d_plotly,
-    structure_3d_plotly,
-)
 from pymatviz.sunburst import chem_sys_sunburst, spacegroup_sunburst
 from pymatviz.templates import (
     pmv_dark_template,
@@ -84,7 +66,85 @@ from pymatviz.templates import (
 from pymatviz.treemap import chem_sys_treemap
 from pymatviz.uncertainty import error_decay_with_uncert, qq_gaussian
 from pymatviz.utils import PKG_DIR, ROOT, df_ptable, html_tag, si_fmt, si_fmt_int
-from pymatviz.xrd import xrd_pattern
+
+
+if TYPE_CHECKING:  # lazily imported below, listed here for static analysis and IDEs
+    from typing import Any
+
+    from pymatviz import (
+        brillouin,
+        classify,
+        cluster,
+        coordination,
+        phonons,
+        rdf,
+        structure_viz,
+        xrd,
+    )
+    from pymatviz.brillouin import brillouin_zone_3d
+    from pymatviz.classify import precision_recall_curve_plotly, roc_curve_plotly
+    from pymatviz.classify.confusion_matrix import confusion_matrix
+    from pymatviz.cluster.composition import cluster_compositions
+    from pymatviz.coordination import coordination_hist, coordination_vs_cutoff_line
+    from pymatviz.phonons import phonon_bands, phonon_bands_and_dos, phonon_dos
+    from pymatviz.rdf.plotly import element_pair_rdfs, full_rdf
+    from pymatviz.structure_viz import (
+        structure_2d,
+        structure_2d_plotly,
+        structure_3d_plotly,
+    )
+    from pymatviz.xrd import xrd_pattern
+
+
+# Submodules with heavy dependencies (e.g. pymatgen.analysis, pymatgen.phonon,
+# scikit-learn, matminer) are only imported on first attribute access (PEP 562) to keep
+# `import pymatviz` fast for users who don't need them.
+_LAZY_SUBMODULES = (
+    "brillouin",
+    "classify",
+    "cluster",
+    "coordination",
+    "phonons",
+    "rdf",
+    "structure_viz",
+    "xrd",
+)
+# map of lazily imported function name to module it is defined in
+_LAZY_FUNCS: dict[str, str] = {
+    "brillouin_zone_3d": "pymatviz.brillouin",
+    "precision_recall_curve_plotly": "pymatviz.classify",
+    "roc_curve_plotly": "pymatviz.classify",
+    "confusion_matrix": "pymatviz.classify.confusion_matrix",
+    "cluster_compositions": "pymatviz.cluster.composition",
+    "coordination_hist": "pymatviz.coordination",
+    "coordination_vs_cutoff_line": "pymatviz.coordination",
+    "phonon_bands": "pymatviz.phonons",
+    "phonon_bands_and_dos": "pymatviz.phonons",
+    "phonon_dos": "pymatviz.phonons",
+    "element_pair_rdfs": "pymatviz.rdf.plotly",
+    "full_rdf": "pymatviz.rdf.plotly",
+    "structure_2d": "pymatviz.structure_viz",
+    "structure_2d_plotly": "pymatviz.structure_viz",
+    "structure_3d_plotly": "pymatviz.structure_viz",
+    "xrd_pattern": "pymatviz.xrd",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazy submodules and functions on first access."""
+    if name in _LAZY_SUBMODULES:
+        # importing a submodule also sets it as attribute on this package
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _LAZY_FUNCS:
+        func = getattr(importlib.import_module(_LAZY_FUNCS[name]), name)
+        globals()[name] = func  # cache so __getattr__ isn't hit again
+        return func
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Include lazy attributes for tab completion."""
+    return sorted({*globals(), *_LAZY_SUBMODULES, *_LAZY_FUNCS})
 
 
 PKG_NAME = "pymatviz"
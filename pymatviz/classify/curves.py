@@ -119,7 +119,8 @@ def roc_curve_plotly(
 
         no_nan = ~np.isnan(targets) & ~np.isnan(curve_probs)
         fpr, tpr, thresholds = skm.roc_curve(targets[no_nan], curve_probs[no_nan])
-        roc_auc = skm.roc_auc_score(targets[no_nan], curve_probs[no_nan])
+        # reuse fpr/tpr to avoid roc_auc_score re-sorting and re-sweeping the probs
+        roc_auc = skm.auc(fpr, tpr)
 
         roc_str = f"AUC={roc_auc:.2f}"
         display_name = f"{name} · {roc_str}" if name else roc_str
@@ -286,6 +286,7 @@ def draw_site(
     *,
     is_image: bool = False,
     is_3d: bool = False,
+    use_webgl: bool = False,
     row: int | None = None,
     col: int | None = None,
     scene: str | None = None,
@@ -293,7 +294,9 @@ def draw_site(
     | Callable[[PeriodicSite], str] = SiteCoords.cartesian_fractional,
     **kwargs: Any,
 ) -> None:
-    """Add a site (regular or image) to the plot."""
+    """Add a site (regular or image) to the plot. 2D sites are drawn as WebGL
+    scattergl traces if use_webgl is True.
+    """
     species = getattr(site, "specie", site.species)
     majority_species = (
         max(species, key=species.get) if isinstance(species, Composition) else species
@@ -337,6 +340,8 @@ def draw_site(
     if is_3d:
         scatter_kwargs["z"] = [coords[2]]
         fig.add_scatter3d(**scatter_kwargs, scene=scene)
+    elif use_webgl:
+        fig.add_scattergl(**scatter_kwargs, row=row, col=col)
     else:
         fig.add_scatter(**scatter_kwargs, row=row, col=col)
 
@@ -39,6 +39,10 @@ if TYPE_CHECKING:
     from pymatviz.typing import ColorType
 
 
+# number of sites above which structure_2d_plotly(render_mode="auto") uses WebGL
+WEBGL_SITE_THRESHOLD = 1000
+
+
 def structure_2d_plotly(
     struct: Structure
     | Sequence[Structure]
@@ -65,6 +69,7 @@ def structure_2d_plotly(
     hover_text: SiteCoords
     | Callable[[PeriodicSite], str] = SiteCoords.cartesian_fractional,
     bond_kwargs: dict[str, Any] | None = None,
+    render_mode: Literal["auto", "svg", "webgl"] = "auto",
 ) -> go.Figure:
     """Plot pymatgen structures in 2D with Plotly.
 
@@ -121,11 +126,24 @@ def structure_2d_plotly(
         bond_kwargs (dict[str, Any], optional): For customizing bond lines. Keys are
             line properties (e.g., "color", "width"), values are the corresponding
             values. Defaults to None.
+        render_mode ("auto" | "svg" | "webgl", optional): Whether to draw atomic sites
+            as SVG (go.Scatter) or WebGL (go.Scattergl) traces. WebGL stays responsive
+            in the browser for many sites, SVG gives crisper static exports. "auto"
+            uses WebGL if the structures have more than WEBGL_SITE_THRESHOLD sites in
+            total. Defaults to "auto".
 
     Returns:
         go.Figure: Plotly figure showing the 2D structure(s).
     """
+    if render_mode not in ("auto", "svg", "webgl"):
+        raise ValueError(
+            f"Invalid {render_mode=}, must be one of 'auto', 'svg', 'webgl'"
+        )
     structures = get_structures(struct)
+    n_sites = sum(len(struct_i) for struct_i in structures.values())
+    use_webgl = render_mode == "webgl" or (
+        render_mode == "auto" and n_sites > WEBGL_SITE_THRESHOLD
+    )
 
     n_structs = len(structures)
     n_cols = min(n_cols, n_structs)
@@ -219,6 +237,7 @@ def structure_2d_plotly(
                     scale,
                     {} if show_sites is True else show_sites,
                     is_3d=False,
+                    use_webgl=use_webgl,
                     row=row,
                     col=col,
                     name=f"site{site_idx}",
@@ -265,6 +284,7 @@ def structure_2d_plotly(
                                 {} if show_image_sites is True else show_image_sites,
                                 is_image=True,
                                 is_3d=False,
+                                use_webgl=use_webgl,
                                 row=row,
                                 col=col,
                             )
@@ -35,7 +35,9 @@ from pymatviz.utils.plotting import (
     get_fig_xy_range,
     get_font_color,
     luminance,
+    luminance_batch,
     pick_max_contrast_color,
+    pick_max_contrast_colors,
     pretty_label,
     validate_fig,
 )
@@ -6,18 +6,22 @@ Available functions:
     - get_font_color: Get the font color used in a Matplotlib or Plotly figure.
     - get_fig_xy_range: Get the x and y range of a plotly or matplotlib figure.
     - luminance: Compute the luminance of a color.
+    - luminance_batch: Compute the luminance of an array of RGB colors at once.
     - pick_max_contrast_color: Choose black or white text color for contrast.
+    - pick_max_contrast_colors: Vectorized pick_max_contrast_color for many colors.
     - pretty_label: Map metric keys to their pretty labels.
     - validate_fig: Decorator to validate the type of fig keyword argument.
 """
 
 from __future__ import annotations
 
-from functools import wraps
+import re
+from functools import lru_cache, wraps
 from typing import TYPE_CHECKING
 
 import matplotlib.colors
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.io as pio
@@ -40,6 +44,24 @@ if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
     from typing import Any
 
+    from numpy.typing import ArrayLike
+
+
+# WCAG 2.0 relative luminance coefficients for linear R, G, B
+_LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+
+# matches CSS-style "rgb(r, g, b)" and "rgba(r, g, b, a)" strings (alpha is ignored)
+_RGB_STR_RE = re.compile(r"rgba?\(\s*([\d.]+)[,\s]+([\d.]+)[,\s]+([\d.]+)")
+
+# matches matplotlib color cycle references like "C0", "C12"
+_NTH_COLOR_RE = re.compile(r"\AC[0-9]+\Z")
+
+# font colors of default plotly templates, keyed by template name (or id() for
+# template objects) so changing pio.templates.default naturally misses the cache.
+# Values also hold the component templates the color was read from so re-registering
+# a template under the same name is detected (and ids can't be reused after GC).
+_FONT_COLOR_CACHE: dict[str | int, tuple[tuple[go.layout.Template, ...], str]] = {}
+
 
 def annotate(text: str | Sequence[str], fig: AxOrFig, **kwargs: Any) -> AxOrFig:
     """Annotate a matplotlib or plotly figure. Supports faceted plots plotly figure with
@@ -59,7 +81,8 @@ def annotate(text: str | Sequence[str], fig: AxOrFig, **kwargs: Any) -> AxOrFig:
     Raises:
         TypeError: If fig is not a Matplotlib or Plotly figure.
     """
-    color = kwargs.pop("color", get_font_color(fig))
+    # only look up the figure's font color if no color was passed
+    color = kwargs.pop("color") if "color" in kwargs else get_font_color(fig)
 
     if isinstance(fig, plt.Figure | plt.Axes):
         ax = fig if isinstance(fig, plt.Axes) else plt.gca()
@@ -75,11 +98,13 @@ def annotate(text: str | Sequence[str], fig: AxOrFig, **kwargs: Any) -> AxOrFig:
             align="left",
         )
 
+        # Read each trace's x-axis once and reuse below for facet detection and
+        # subplot refs (traces without xaxis like pie charts map to None)
+        x_axes = [getattr(trace, "xaxis", None) for trace in fig.data]
+
         # Annotate all subplots or main plot if not faceted
-        if any(
-            getattr(trace, "xaxis", None) not in (None, "x") for trace in fig.data
-        ):  # Faceted plot
-            for idx, trace in enumerate(fig.data):
+        if any(x_axis not in (None, "x") for x_axis in x_axes):  # Faceted plot
+            for idx, x_axis in enumerate(x_axes):
                 # if text is str, use it for all subplots though we might want to
                 # warn since this will likely rarely be intended
                 sub_text = text if isinstance(text, str) else text[idx]
@@ -87,7 +112,7 @@ def annotate(text: str | Sequence[str], fig: AxOrFig, **kwargs: Any) -> AxOrFig:
                 if not sub_text:
                     continue
 
-                subplot_idx = trace.xaxis[1:] or ""  # e.g. 'x2' -> '2', 'x' -> ''
+                subplot_idx = (x_axis or "x")[1:]  # e.g. 'x2' -> '2', 'x' -> ''
                 xref = f"x{subplot_idx} domain" if subplot_idx else "x domain"
                 yref = f"y{subplot_idx} domain" if subplot_idx else "y domain"
                 fig.add_annotation(
@@ -124,6 +149,37 @@ def apply_matplotlib_template() -> None:
     plt.rcParams["figure.constrained_layout.use"] = True
 
 
+def _default_template_font_color() -> str:
+    """Get the font color of the current default Plotly template (pio.templates.default)
+    or "black" if it doesn't set one. Cached in _FONT_COLOR_CACHE per default template.
+
+    Note: in-place edits of an already cached template (e.g.
+    pio.templates["plotly"].layout.font.color = "red") are not detected. Call
+    _FONT_COLOR_CACHE.clear() after mutating a template in place.
+    """
+    template = pio.templates.default
+    if isinstance(template, str):
+        cache_key: str | int = template
+        # look up components of combined templates like "plotly_dark+presentation"
+        # one by one since pio.templates[name] merges them into a new object each call
+        components = tuple(pio.templates[name] for name in template.split("+"))
+    else:
+        cache_key, components = id(template), (template,)
+
+    cached = _FONT_COLOR_CACHE.get(cache_key)
+    if cached is None or any(
+        old is not new for old, new in zip(cached[0], components, strict=True)
+    ):
+        if isinstance(template, str):
+            template = pio.templates[template]
+        font_color = (
+            template.layout and template.layout.font and template.layout.font.color
+        ) or "black"
+        cached = _FONT_COLOR_CACHE[cache_key] = (components, font_color)
+
+    return cached[1]
+
+
 def _get_plotly_font_color(fig: go.Figure) -> str:
     """Get the font color used in a Plotly figure.
 
@@ -133,24 +189,15 @@ def _get_plotly_font_color(fig: go.Figure) -> str:
     Returns:
         str: The font color as a string (e.g. 'black', '#000000').
     """
-    if fig.layout.font and fig.layout.font.color:
-        return fig.layout.font.color
-
-    if (
-        fig.layout.template
-        and fig.layout.template.layout
-        and fig.layout.template.layout.font
-        and fig.layout.template.layout.font.color
-    ):
-        return fig.layout.template.layout.font.color
-
-    template = pio.templates.default
-    if isinstance(template, str):
-        template = pio.templates[template]
-    if template.layout and template.layout.font and template.layout.font.color:
-        return template.layout.font.color
+    # bind intermediate layouts once since each plotly property access is validated
+    layout = fig.layout
+    template_layout = layout.template and layout.template.layout
 
-    return "black"
+    return (
+        (layout.font and layout.font.color)
+        or (template_layout and template_layout.font and template_layout.font.color)
+        or _default_template_font_color()
+    )
 
 
 def _get_matplotlib_font_color(fig: plt.Figure | plt.Axes) -> str:
@@ -199,18 +246,29 @@ def get_font_color(fig: AxOrFig) -> str:
     raise TypeError(f"Input must be {VALID_FIG_NAMES}, got {type(fig)=}")
 
 
-def luminance(color: ColorType) -> float:
-    """Compute the relative luminance of a color using the WCAG 2.0 formula.
+def _color_to_rgb(color: ColorType) -> tuple[float, float, float]:
+    """Convert a color to an RGB tuple normalized to [0, 1]. Cached since the same
+    (usually few) palette colors get parsed over and over in per-cell hot loops,
+    except for color cycle references like "C0" which depend on
+    rcParams["axes.prop_cycle"] (matplotlib doesn't cache those either).
 
     Args:
         color (ColorType): RGB color tuple with values in [0, 1] or [0, 255], or a color
-            string that can be converted to RGB.
+            string that can be converted to RGB. Must be hashable.
 
     Returns:
-        float: Relative luminance of the color in range [0, 1].
+        tuple[float, float, float]: RGB values in [0, 1] (alpha dropped).
     """
-    if isinstance(color, str) and color.startswith("rgb("):
-        r, g, b, *_a = map(float, color.strip("rgb()").split(","))
+    if isinstance(color, str) and _NTH_COLOR_RE.match(color):
+        return matplotlib.colors.to_rgb(color)
+    return _cached_color_to_rgb(color)
+
+
+@lru_cache(maxsize=4096)
+def _cached_color_to_rgb(color: ColorType) -> tuple[float, float, float]:
+    """Cached implementation of _color_to_rgb for colors independent of rcParams."""
+    if isinstance(color, str) and (rgb_match := _RGB_STR_RE.match(color)):
+        r, g, b = map(float, rgb_match.groups())
         if r > 1 or g > 1 or b > 1:
             r, g, b = r / 255, g / 255, b / 255
     elif isinstance(color, tuple) and len(color) >= 3:
@@ -223,6 +281,31 @@ def luminance(color: ColorType) -> float:
         # raises ValueError if color invalid
         r, g, b, *_a = matplotlib.colors.to_rgba(color)
 
+    return r, g, b
+
+
+def _hashable_color(color: ColorType) -> ColorType:
+    """Convert list or array colors to tuples so they can be used as cache keys."""
+    return tuple(color) if isinstance(color, list | np.ndarray) else color
+
+
+def _rgb_to_linear(rgb: np.ndarray) -> np.ndarray:
+    """Convert RGB values in [0, 1] to linear RGB (remove gamma correction)."""
+    return np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def luminance(color: ColorType) -> float:
+    """Compute the relative luminance of a color using the WCAG 2.0 formula.
+
+    Args:
+        color (ColorType): RGB color tuple with values in [0, 1] or [0, 255], or a color
+            string that can be converted to RGB.
+
+    Returns:
+        float: Relative luminance of the color in range [0, 1].
+    """
+    r, g, b = _color_to_rgb(_hashable_color(color))
+
     def _convert_rgb_to_linear(rgb: float) -> float:
         """Convert an RGB value to linear RGB (remove gamma correction)."""
         return rgb / 12.92 if rgb <= 0.03928 else ((rgb + 0.055) / 1.055) ** 2.4
@@ -234,6 +317,28 @@ def luminance(color: ColorType) -> float:
     return 0.2126 * r + 0.7152 * g + 0.0722 * b
 
 
+def luminance_batch(colors: ArrayLike) -> np.ndarray:
+    """Compute the relative luminance of many RGB colors at once using the WCAG 2.0
+    formula. Vectorized alternative to calling luminance() per color, e.g. for every
+    cell of a periodic table or heatmap.
+
+    Args:
+        colors (ArrayLike): Array of shape (N, 3) (or (N, 4), alpha is ignored) with
+            RGB values in [0, 1] or [0, 255]. Rows with any value > 1 are treated as
+            [0, 255].
+
+    Returns:
+        np.ndarray: Relative luminances of shape (N,) in range [0, 1].
+    """
+    rgb = np.asarray(colors, dtype=float)
+    if rgb.ndim != 2 or rgb.shape[1] not in (3, 4):
+        raise ValueError(f"colors must have shape (N, 3) or (N, 4), got {rgb.shape}")
+    rgb = rgb[:, :3]
+    rgb = np.where((rgb > 1).any(axis=1, keepdims=True), rgb / 255, rgb)
+
+    return _rgb_to_linear(rgb) @ _LUMINANCE_WEIGHTS
+
+
 def contrast_ratio(color1: ColorType, color2: ColorType) -> float:
     """Calculate the contrast ratio between two colors according to WCAG 2.0.
 
@@ -293,6 +398,49 @@ def pick_max_contrast_color(
     return colors[contrast_ratios.index(max(contrast_ratios))]
 
 
+def pick_max_contrast_colors(
+    bg_colors: Sequence[ColorType] | np.ndarray,
+    colors: tuple[ColorType, ColorType] = ("white", "black"),
+    min_contrast_ratio: float = 2.0,
+) -> list[ColorType]:
+    """Vectorized version of pick_max_contrast_color() for many background colors,
+    e.g. one text color per cell of a periodic table or heatmap. Uses the same
+    selection rule but computes all luminances and contrast ratios in one pass.
+
+    Args:
+        bg_colors (Sequence[ColorType] | np.ndarray): Background colors. Either a
+            sequence of colors accepted by luminance() or an (N, 3) RGB array.
+        colors (tuple[ColorType, ColorType], optional): Text colors to choose
+            from. Defaults to ("white", "black").
+        min_contrast_ratio (float, optional): Minimum contrast ratio to prefer
+            colors[0] over colors[1]. Defaults to 2.0.
+
+    Returns:
+        list[ColorType]: item in `colors` with best contrast for each bg color.
+    """
+    if isinstance(bg_colors, np.ndarray) and bg_colors.ndim == 2:
+        rgb = bg_colors
+    else:  # each unique color string is only parsed once thanks to caching
+        rgb = [_color_to_rgb(_hashable_color(color)) for color in bg_colors]
+    if len(rgb) == 0:
+        return []
+    bg_lum = luminance_batch(rgb)
+
+    text_lums = np.array([luminance(color) for color in colors])
+    # broadcast to (N, 2) contrast ratios between each bg color and each text color
+    lighter = np.maximum(bg_lum[:, None], text_lums[None, :])
+    darker = np.minimum(bg_lum[:, None], text_lums[None, :])
+    contrast_ratios = (lighter + 0.05) / (darker + 0.05)
+
+    # prefer colors[0] above min_contrast_ratio, else whichever contrasts most
+    color_idx = np.where(
+        contrast_ratios[:, 0] >= min_contrast_ratio,
+        0,
+        contrast_ratios.argmax(axis=1),
+    )
+    return [colors[idx] for idx in color_idx]
+
+
 def pretty_label(key: str, backend: Backend) -> str:
     """Map metric keys to their pretty labels."""
     if backend not in BACKENDS:
@@ -328,6 +476,19 @@ def validate_fig(func: Callable[P, R]) -> Callable[P, R]:
     return wrapper
 
 
+def _to_float_array(values: ArrayLike | None) -> np.ndarray | None:
+    """Convert numeric trace data (possibly with None for missing values) to a float
+    array. Returns None for non-numeric data like category or date strings.
+    """
+    arr = np.asarray(values)
+    if arr.ndim != 1 or arr.dtype.kind not in "iufO":
+        return None
+    try:  # object arrays are numeric if they only hold numbers and None
+        return arr.astype(float)
+    except (TypeError, ValueError):
+        return None
+
+
 @validate_fig
 def get_fig_xy_range(
     fig: go.Figure | plt.Figure | plt.Axes,
@@ -361,13 +522,28 @@ def get_fig_xy_range(
     # If so, we resort to manually computing the xy data ranges which are usually are
     # close to but not the same as the axes limits.
     try:
-        # https://stackoverflow.com/a/62042077
-        dev_fig = fig.full_figure_for_development(warn=False)
-        x_axis_type = dev_fig.layout.xaxis.type
-        y_axis_type = dev_fig.layout.yaxis.type
+        x_axis_type, y_axis_type = fig.layout.xaxis.type, fig.layout.yaxis.type
+        x_range, y_range = fig.layout.xaxis.range, fig.layout.yaxis.range
+
+        # Only render the full figure (expensive, runs plotly.js via kaleido) if axis
+        # ranges weren't fully set explicitly (partial ranges like [0, None] and
+        # autorange still need plotly.js to compute the missing endpoints)
+        if not all(
+            axis_range is not None
+            and None not in axis_range
+            and axis.autorange in (None, False)
+            for axis, axis_range in (
+                (fig.layout.xaxis, x_range),
+                (fig.layout.yaxis, y_range),
+            )
+        ):
+            # https://stackoverflow.com/a/62042077
+            dev_fig = fig.full_figure_for_development(warn=False)
+            x_axis_type = dev_fig.layout.xaxis.type
+            y_axis_type = dev_fig.layout.yaxis.type
 
-        x_range = dev_fig.layout.xaxis.range
-        y_range = dev_fig.layout.yaxis.range
+            x_range = dev_fig.layout.xaxis.range
+            y_range = dev_fig.layout.yaxis.range
 
         # Convert log range to linear if necessary
         if x_axis_type == "log":
@@ -392,17 +568,37 @@ def get_fig_xy_range(
                     break
 
         trace = fig.data[trace_index]
-        df_xy = pd.DataFrame({"x": trace.x, "y": trace.y}).dropna()
+        x_vals, y_vals = _to_float_array(trace.x), _to_float_array(trace.y)
+        if x_vals is not None and y_vals is not None:
+            # numeric data: reduce raw arrays directly rather than building a
+            # NaN-filtered copy
+            for axis, vals in (("x", x_vals), ("y", y_vals)):
+                if np.isnan(vals).all():
+                    raise ValueError(
+                        f"Can't determine {axis} range, trace {trace_index} has no "
+                        f"non-NaN {axis} values"
+                    ) from None
+            x_min, x_max = np.nanmin(x_vals), np.nanmax(x_vals)
+            y_min, y_max = np.nanmin(y_vals), np.nanmax(y_vals)
+        else:  # e.g. category or date axes, or missing x/y
+            df_xy = pd.DataFrame({"x": trace.x, "y": trace.y}).dropna()
+            if df_xy.empty:
+                raise ValueError(
+                    f"Can't determine x/y range, trace {trace_index} has no rows "
+                    "with both x and y values"
+                ) from None
+            x_min, x_max = min(df_xy.x), max(df_xy.x)
+            y_min, y_max = min(df_xy.y), max(df_xy.y)
 
         # Determine ranges based on the type of axes
         if fig.layout.xaxis.type == "log":
-            x_range = [10**val for val in (min(df_xy.x), max(df_xy.x))]
+            x_range = [10**val for val in (x_min, x_max)]
         else:
-            x_range = [min(df_xy.x), max(df_xy.x)]
+            x_range = [x_min, x_max]
 
         if fig.layout.yaxis.type == "log":
-            y_range = [10**val for val in (min(df_xy.y), max(df_xy.y))]
+            y_range = [10**val for val in (y_min, y_max)]
         else:
-            y_range = [min(df_xy.y), max(df_xy.y)]
+            y_range = [y_min, y_max]
 
     return x_range, y_range
@@ -9,6 +9,7 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import pytest
+from matplotlib.figure import Figure
 from plotly.subplots import make_subplots
 from pymatgen.core import Lattice, Structure
 
@@ -66,6 +67,15 @@ def _run_around_tests() -> Generator[None, None, None]:
     plt.close()
 
 
+@pytest.fixture(scope="module")
+def shared_fig() -> plt.Figure:
+    """Matplotlib figure reused across all tests in a module to avoid repeated
+    figure setup in heavily parametrized tests. Call shared_fig.clear() before use.
+    Not registered with pyplot, so unaffected by plt.close() in _run_around_tests.
+    """
+    return Figure(figsize=(5, 5))
+
+
 @pytest.fixture
 def spg_symbols() -> list[str]:
     symbols = ["C2/m", "C2/m", "Fm-3m", "C2/m", "Cmc2_1", "P4/nmm", "P-43m", "P-43m"]
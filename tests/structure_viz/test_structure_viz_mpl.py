@@ -32,9 +32,12 @@ def test_structure_2d(
     show_bonds: bool | NearNeighbors,
     standardize_struct: bool | None,
     fe3co4_disordered: Structure,
+    shared_fig: plt.Figure,
 ) -> None:
+    shared_fig.clear()
     ax = pmv.structure_2d(
         fe3co4_disordered,
+        ax=shared_fig.add_subplot(),
         atomic_radii=radii,
         rotation=rotation,
         show_bonds=show_bonds,
@@ -20,6 +20,7 @@ from pymatviz.structure_viz.helpers import (
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from typing import Literal
 
     from pymatgen.core import PeriodicSite
 
@@ -256,6 +257,30 @@ def test_structure_2d_plotly_invalid_input() -> None:
     with pytest.raises(ValueError, match="Invalid site_labels=123. Must be one of "):
         pmv.structure_2d_plotly(struct, site_labels=123)  # type: ignore[arg-type]
 
+    with pytest.raises(ValueError, match="Invalid render_mode='canvas', must be one"):
+        pmv.structure_2d_plotly(struct, render_mode="canvas")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("render_mode", "n_repeats", "expected_type"),
+    [
+        ("auto", 1, "scatter"),
+        ("auto", 9, "scattergl"),  # 2 * 9**3 = 1458 sites > 1000
+        ("svg", 9, "scatter"),
+        ("webgl", 1, "scattergl"),
+    ],
+)
+def test_structure_2d_plotly_render_mode(
+    render_mode: Literal["auto", "svg", "webgl"], n_repeats: int, expected_type: str
+) -> None:
+    struct = Structure(lattice_cubic, ["Fe", "O"], COORDS) * n_repeats
+    fig = pmv.structure_2d_plotly(
+        struct, render_mode=render_mode, show_unit_cell=False, show_image_sites=False
+    )
+    site_traces = [trace for trace in fig.data if trace.name.startswith("site")]
+    assert len(site_traces) == len(struct)
+    assert {trace.type for trace in site_traces} == {expected_type}
+
 
 @pytest.mark.parametrize(
     "kwargs",
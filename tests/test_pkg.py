@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import json
 import os
+import subprocess
 import sys
 from glob import glob
 from importlib.metadata import version
 from types import ModuleType
 
+import pytest
+
 import pymatviz as pmv
 
 
@@ -78,3 +81,25 @@ def test_all_modules_reexported() -> None:
 
 def test_is_ipython() -> None:
     assert not pmv.IS_IPYTHON
+
+
+def test_lazy_imports() -> None:
+    # run in fresh interpreter since the test session already imported everything
+    code = (
+        "import sys, pymatviz; "
+        "print(sorted(mod for mod in pymatviz._LAZY_SUBMODULES "
+        "if f'pymatviz.{mod}' in sys.modules))"
+    )
+    stdout = subprocess.check_output([sys.executable, "-c", code], text=True)  # noqa: S603
+    assert stdout.strip() == "[]", f"eagerly imported: {stdout}"
+
+    for func_name, module_name in pmv._LAZY_FUNCS.items():
+        func = getattr(pmv, func_name)
+        assert func is getattr(sys.modules[module_name], func_name)
+        assert func_name in dir(pmv)
+    for module_name in pmv._LAZY_SUBMODULES:
+        assert isinstance(getattr(pmv, module_name), ModuleType)
+        assert module_name in dir(pmv)
+
+    with pytest.raises(AttributeError, match="module 'pymatviz' has no attribute"):
+        _ = pmv.not_a_pymatviz_attr
@@ -16,7 +16,11 @@ from pymatgen.core import Lattice, Structure
 import pymatviz as pmv
 from pymatviz.typing import MATPLOTLIB, PLOTLY, VALID_FIG_NAMES, CrystalSystem
 from pymatviz.utils import normalize_to_dict
-from pymatviz.utils.plotting import _get_matplotlib_font_color, _get_plotly_font_color
+from pymatviz.utils.plotting import (
+    _FONT_COLOR_CACHE,
+    _get_matplotlib_font_color,
+    _get_plotly_font_color,
+)
 from tests.conftest import y_pred, y_true
 
 
@@ -450,6 +454,92 @@ def test_get_fig_xy_range(
         pmv.utils.get_fig_xy_range(fig="invalid")
 
 
+def test_get_fig_xy_range_skips_full_figure(
+    plotly_scatter: go.Figure, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    n_calls = 0
+    orig_full_fig = go.Figure.full_figure_for_development
+
+    def counting_full_fig(self: go.Figure, *args: Any, **kwargs: Any) -> go.Figure:
+        nonlocal n_calls
+        n_calls += 1
+        return orig_full_fig(self, *args, **kwargs)
+
+    monkeypatch.setattr(go.Figure, "full_figure_for_development", counting_full_fig)
+
+    # explicitly set axis ranges are returned without rendering the full figure
+    fig = go.Figure(plotly_scatter)
+    fig.layout.xaxis.range = (0, 10)
+    fig.layout.yaxis.range = (-1, 1)
+    assert pmv.utils.get_fig_xy_range(fig) == ((0, 10), (-1, 1))
+    assert n_calls == 0
+
+    # log axis ranges are in log10 units and converted to linear
+    fig.layout.xaxis.type = "log"
+    assert pmv.utils.get_fig_xy_range(fig) == ([1, 10**10], (-1, 1))
+    assert n_calls == 0
+
+    # auto-ranged figures are rendered on every call and reflect data/layout changes
+    pytest.importorskip("kaleido")
+    fig = go.Figure(plotly_scatter)
+    _ = pmv.utils.get_fig_xy_range(fig)
+    assert n_calls == 1
+    fig.update_traces(x=[0, 100], y=[0, 100])
+    (x_min, x_max), _y_range = pmv.utils.get_fig_xy_range(fig)
+    assert x_min < 0
+    assert x_max > 100
+    assert n_calls == 2
+    fig.layout.xaxis.type = "log"
+    (new_x_min, new_x_max), _y_range = pmv.utils.get_fig_xy_range(fig)
+    assert (new_x_min, new_x_max) != (x_min, x_max)
+
+    # partial ranges and autorange still render the full figure to fill in endpoints
+    fig = go.Figure(go.Scatter(x=[0, 1, 2, 3], y=[4, 5, 6, 7]))
+    fig.update_xaxes(range=[0, None]).update_yaxes(range=[None, 10])
+    (x_min, x_max), (y_min, y_max) = pmv.utils.get_fig_xy_range(fig)
+    assert n_calls == 4
+    assert x_min == 0
+    assert x_max > 3
+    assert y_min < 4
+    assert y_max == 10
+    pmv.powerups.add_identity_line(fig)  # used to raise TypeError on None endpoints
+
+    fig.update_xaxes(range=[0, 1], autorange=True).update_yaxes(range=[0, 1])
+    (x_min, x_max), y_range = pmv.utils.get_fig_xy_range(fig)
+    assert x_min < 0
+    assert x_max > 3
+    assert y_range == (0, 1)
+
+
+def test_get_fig_xy_range_without_kaleido(monkeypatch: pytest.MonkeyPatch) -> None:
+    def raise_value_error(*_args: Any, **_kwargs: Any) -> None:
+        raise ValueError("Full figure generation requires the kaleido package")
+
+    monkeypatch.setattr(go.Figure, "full_figure_for_development", raise_value_error)
+
+    # NaNs are ignored when falling back to data ranges
+    fig = go.Figure(go.Scatter(x=[1, float("nan"), 3, 2], y=[5, 4, None, 6]))
+    fig.add_scatter(x=[-10, 10], y=[-10, 10])
+    assert pmv.utils.get_fig_xy_range(fig) == ([1, 3], [4, 6])
+    assert pmv.utils.get_fig_xy_range(fig, traces=1) == ([-10, 10], [-10, 10])
+
+    fig.layout.yaxis.type = "log"
+    assert pmv.utils.get_fig_xy_range(fig) == ([1, 3], [10**4, 10**6])
+
+    # non-numeric category and date axes fall back to min/max of values
+    fig = go.Figure(go.Scatter(x=["a", "b", "c"], y=[1, 2, 3]))
+    assert pmv.utils.get_fig_xy_range(fig) == (["a", "c"], [1, 3])
+    fig = go.Figure(go.Scatter(x=["2024-01-01", "2024-02-01"], y=[1, 2]))
+    assert pmv.utils.get_fig_xy_range(fig) == (["2024-01-01", "2024-02-01"], [1, 2])
+
+    # clear errors if an axis has no usable values
+    fig = go.Figure(go.Scatter(x=[1, 2], y=[float("nan")] * 2))
+    with pytest.raises(ValueError, match="trace 0 has no non-NaN y values"):
+        pmv.utils.get_fig_xy_range(fig)
+    with pytest.raises(ValueError, match="no rows with both x and y values"):
+        pmv.utils.get_fig_xy_range(go.Figure(go.Scatter(y=[1, 2])))
+
+
 def test_get_font_color() -> None:
     orig_template = pio.templates.default
     try:
@@ -497,6 +587,57 @@ def test_get_plotly_font_color_from_template() -> None:
         pio.templates.default = "plotly"  # Reset to default template
 
 
+def test_get_plotly_font_color_default_template_cache() -> None:
+    orig_template = pio.templates.default
+    # empty figure template to force fallback to the default template
+    fig = go.Figure(layout=dict(template=go.layout.Template()))
+    try:
+        pio.templates.default = "plotly"
+        assert _get_plotly_font_color(fig) == "#2a3f5f"
+        assert _FONT_COLOR_CACHE["plotly"][1] == "#2a3f5f"
+
+        # changing the default template must not return the stale cached color
+        pio.templates.default = "plotly_dark"
+        assert _get_plotly_font_color(fig) == "#f2f5fa"
+        assert _FONT_COLOR_CACHE["plotly_dark"][1] == "#f2f5fa"
+    finally:
+        pio.templates.default = orig_template
+
+
+def test_get_plotly_font_color_default_template_reregistered() -> None:
+    orig_template = pio.templates.default
+    fig = go.Figure(layout=dict(template=go.layout.Template()))
+    try:
+        pio.templates["test_font_tmpl"] = go.layout.Template(layout_font_color="red")
+        pio.templates.default = "test_font_tmpl"
+        assert _get_plotly_font_color(fig) == "red"
+
+        # re-registering a template under the same name must miss the cache
+        pio.templates["test_font_tmpl"] = go.layout.Template(layout_font_color="blue")
+        assert _get_plotly_font_color(fig) == "blue"
+
+        # combined templates are merged into a new object on every lookup but must
+        # still hit a single cache entry
+        pio.templates.default = "test_font_tmpl+presentation"
+        assert _get_plotly_font_color(fig) == "blue"
+        n_cached = len(_FONT_COLOR_CACHE)
+        for _ in range(100):
+            assert _get_plotly_font_color(fig) == "blue"
+        assert len(_FONT_COLOR_CACHE) == n_cached
+        assert _FONT_COLOR_CACHE["test_font_tmpl+presentation"][1] == "blue"
+        pio.templates["test_font_tmpl"] = go.layout.Template(layout_font_color="gray")
+        assert _get_plotly_font_color(fig) == "gray"
+
+        # in-place edits are only picked up after clearing the cache
+        pio.templates.default = "test_font_tmpl"
+        pio.templates["test_font_tmpl"].layout.font.color = "green"
+        _FONT_COLOR_CACHE.clear()
+        assert _get_plotly_font_color(fig) == "green"
+    finally:
+        pio.templates.default = orig_template
+        del pio.templates["test_font_tmpl"]
+
+
 @pytest.mark.parametrize("color", ["red", "#00FF00", "rgb(0, 0, 255)"])
 def test_get_plotly_font_color(color: str) -> None:
     fig = go.Figure().update_layout(font_color=color)
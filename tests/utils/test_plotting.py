@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import matplotlib.pyplot as plt
+import numpy as np
 import pytest
+from cycler import cycler
 
 import pymatviz as pmv
 from pymatviz.utils.plotting import contrast_ratio
@@ -35,6 +38,7 @@ if TYPE_CHECKING:
         ("rgb(255, 255, 255)", 1.0),  # White in RGB format
         ("rgb(0, 0, 0)", 0.0),  # Black in RGB format
         ("rgb(255, 0, 0, 0.5)", 0.2126),  # Red with alpha
+        ("rgba(0, 255, 0, 0.5)", 0.7152),  # Green in RGBA format
         # Edge cases
         ("rgb(255,0,0)", 0.2126),  # No spaces
         ("rgb( 255, 0, 0 )", 0.2126),  # Extra spaces
@@ -161,6 +165,68 @@ def test_pick_max_contrast_color_with_custom_colors() -> None:
     )
 
 
+def test_luminance_batch() -> None:
+    colors = [(0, 0, 0), (1, 1, 1), (0.5, 0.5, 0.5), (1, 0, 0), (0, 255, 0)]
+    expected = [pmv.utils.luminance(color) for color in colors]
+    actual = pmv.utils.luminance_batch(colors)
+    assert actual.shape == (len(colors),)
+    assert actual == pytest.approx(expected)
+
+    # alpha channel is ignored
+    rgba = np.array([[0, 0, 1, 0.3], [1, 0, 0, 1]])
+    assert pmv.utils.luminance_batch(rgba) == pytest.approx([0.0722, 0.2126])
+
+    with pytest.raises(ValueError, match="colors must have shape"):
+        pmv.utils.luminance_batch([0.1, 0.2, 0.3])
+
+
+@pytest.mark.parametrize(
+    ("colors", "min_contrast_ratio"),
+    [(("white", "black"), 2.0), (("red", "blue"), 10), (("yellow", "green"), 1.0)],
+)
+def test_pick_max_contrast_colors(
+    colors: tuple[str, str], min_contrast_ratio: float
+) -> None:
+    bg_colors = [
+        "black",
+        "white",
+        "#000080",
+        "#90EE90",
+        "rgb(77, 77, 77)",
+        "rgb(200, 200, 200)",
+        (0.5, 0.5, 0.5),
+        (0, 1, 0),
+        [1, 0, 0, 0.3],
+    ]
+    expected = [
+        pmv.utils.pick_max_contrast_color(
+            color, colors=colors, min_contrast_ratio=min_contrast_ratio
+        )
+        for color in bg_colors
+    ]
+    actual = pmv.utils.pick_max_contrast_colors(
+        bg_colors, colors=colors, min_contrast_ratio=min_contrast_ratio
+    )
+    assert actual == expected
+
+    # also accepts an (N, 3) RGB array
+    rgb_arr = np.array([[0, 0, 0], [1, 1, 1], [0, 0, 1.0]])
+    assert pmv.utils.pick_max_contrast_colors(rgb_arr) == ["white", "black", "white"]
+    assert pmv.utils.pick_max_contrast_colors([]) == []
+
+
+def test_luminance_unhashable_input() -> None:
+    assert pmv.utils.luminance([1, 0, 0]) == pytest.approx(0.2126)
+    assert pmv.utils.luminance(np.array([0, 1, 0])) == pytest.approx(0.7152)
+
+
+def test_luminance_color_cycle_not_cached() -> None:
+    with plt.rc_context({"axes.prop_cycle": cycler(color=["black"])}):
+        assert pmv.utils.luminance("C0") == pytest.approx(0)
+    with plt.rc_context({"axes.prop_cycle": cycler(color=["white"])}):
+        assert pmv.utils.luminance("C0") == pytest.approx(1)
+
+
 def test_contrast_ratio() -> None:
     """Test the contrast_ratio function with various color combinations."""
     # Test black and white (should be 21:1)